@@ -7,14 +7,24 @@ Code blocks marked with ```python become code cells, everything else becomes mar
 
 Usage:
     python convert.py input_file.md output_file.ipynb
+    python convert.py input_dir/ output_dir/
 """
 
 import nbformat
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 import argparse
+import re
 import sys
 
 
+# Matches a whole fence line (```python, ```bash, ```, ...) including its newline
+# The ```python line opens a code cell, any other fence line goes back to markdown
+# Fence lines themselves are not included in the cells
+FENCE_PATTERN = re.compile(r"^[ \t]*```(python)?[^\n]*\n?", re.MULTILINE)
+
+
 def convert_markdown_to_notebook(input_path: Path, output_path: Path) -> None:
     """
     Convert a markdown file to a Jupyter notebook.
@@ -35,67 +45,45 @@ def convert_markdown_to_notebook(input_path: Path, output_path: Path) -> None:
         print(f"Error: Could not read '{input_path}' as UTF-8 text.")
         sys.exit(1)
 
-    # Initialize variables for cell parsing
     cells = []  # List to store all notebook cells
-    current_lines = []  # Buffer to accumulate lines for the current cell
-    cell_type = "markdown"  # Track whether we're in a markdown or code cell
-
-    def flush_current_cell():
-        """
-        Helper function to process the accumulated lines and create a cell.
-        This is called when we finish collecting lines for a cell.
-        """
-        # Access the module-level variables
-        nonlocal current_lines, cell_type, cells
-
-        # Skip empty cells
-        if not current_lines:
-            return
-
-        # Join all lines and clean up extra newlines
-        content = "\n".join(current_lines).strip("\n")
-
-        # Create the appropriate cell type based on current context
-        if cell_type == "code":
-            # Create a code cell with no execution count or outputs
-            # (these will be populated when the notebook is actually run)
-            cell = nbformat.v4.new_code_cell(
-                source=content,
-                execution_count=None,  # Will be set when executed
-                outputs=[]  # Will be populated when executed
-            )
-        else:
-            # Create a markdown cell
-            cell = nbformat.v4.new_markdown_cell(source=content)
-
-        cells.append(cell)
-
-        # Clear the buffer for the next cell
-        current_lines = []
-
-    # Parse the markdown text line by line
-    for line in markdown_text.splitlines():
-
-        # Check if this line starts a Python code block
-        if line.strip().startswith("```python"):
-            # Finish the current cell (likely markdown) before starting code
-            flush_current_cell()
-            cell_type = "code"
-            # Don't include the ```python line in the code cell
-
-        # Check if this line ends any code block
-        elif line.strip().startswith("```") and not line.strip().startswith("```python"):
-            # Finish the current code cell
-            flush_current_cell()
-            cell_type = "markdown"
-            # Don't include the closing ``` line in the next markdown cell
-
-        else:
-            # This is a regular content line - add it to the current cell
-            current_lines.append(line)
-
-    # Don't forget to flush the last cell after processing all lines
-    flush_current_cell()
+    code_cells = markdown_cells = 0  # Count cell types for user feedback
+    cell_type = "markdown"  # The text before the first fence is always markdown
+    cell_start = 0  # Offset in markdown_text where the current cell begins
+
+    # Find the fence lines in a single pass over the text
+    # Cells are tracked as offsets into markdown_text and sliced once, instead of
+    # copying every line into a buffer and joining the lines back together
+    # The trailing None closes the last cell at the end of the text
+    for fence in [*FENCE_PATTERN.finditer(markdown_text), None]:
+        cell_end = fence.start() if fence else len(markdown_text)
+
+        # Skip empty cells (e.g. two fences directly following each other)
+        if cell_end > cell_start:
+            # Clean up extra newlines around the cell content
+            content = markdown_text[cell_start:cell_end].strip("\n")
+
+            # Create the appropriate cell type based on current context
+            if cell_type == "code":
+                # Create a code cell with no execution count or outputs
+                # (these will be populated when the notebook is actually run)
+                cell = nbformat.v4.new_code_cell(
+                    source=content,
+                    execution_count=None,  # Will be set when executed
+                    outputs=[]  # Will be populated when executed
+                )
+                code_cells += 1
+            else:
+                # Create a markdown cell
+                cell = nbformat.v4.new_markdown_cell(source=content)
+                markdown_cells += 1
+
+            cells.append(cell)
+
+        # The next cell starts right after the fence line:
+        # code after ```python, markdown after any other fence
+        if fence:
+            cell_type = "code" if fence.group(1) else "markdown"
+            cell_start = fence.end()
 
     # Create the notebook structure
     # nbformat.v4 creates a notebook compatible with Jupyter notebook format version 4
@@ -119,14 +107,16 @@ def convert_markdown_to_notebook(input_path: Path, output_path: Path) -> None:
 
     # Write the notebook to disk
     try:
+        # The cells are built with nbformat.v4 helpers, so the notebook is valid by
+        # construction: serialize it with the v4 JSON writer directly instead of
+        # nbformat.write(), which validates the whole notebook against the schema
+        # The writer keeps nbformat's layout (sources split into lines, sorted keys)
+        # The notebook is serialized in memory and written to disk in one call
+        content = nbformat.v4.nbjson.writes(notebook) + "\n"
         with open(output_path, "w", encoding="utf-8") as f:
-            nbformat.write(notebook, f)
+            f.write(content)
         print(f"✅ Notebook successfully saved to '{output_path}'")
         print(f"📊 Created {len(cells)} cells total")
-
-        # Count cell types for user feedback
-        code_cells = sum(1 for cell in cells if cell.cell_type == "code")
-        markdown_cells = sum(1 for cell in cells if cell.cell_type == "markdown")
         print(f"   - {code_cells} code cells")
         print(f"   - {markdown_cells} markdown cells")
 
@@ -135,26 +125,78 @@ def convert_markdown_to_notebook(input_path: Path, output_path: Path) -> None:
         sys.exit(1)
 
 
+def convert_directory(input_dir: Path, output_dir: Path, force: bool = False,
+                      max_workers: Optional[int] = None) -> None:
+    """
+    Convert every markdown file of a directory (recursively) to Jupyter notebooks.
+
+    Each file is converted independently, so the conversions are spread over
+    several processes to use all the CPU cores.
+
+    Args:
+        input_dir: Directory containing the markdown files
+        output_dir: Directory where the notebooks will be saved, keeping the
+            same sub-directory structure as input_dir
+        force: Overwrite notebooks that already exist (skipped otherwise)
+        max_workers: Number of processes to use (default: number of CPUs)
+    """
+    # Pair each markdown file with the path of its notebook
+    jobs = []
+    for md_path in sorted(input_dir.rglob("*.md")):
+        ipynb_path = output_dir / md_path.relative_to(input_dir).with_suffix(".ipynb")
+        if ipynb_path.exists() and not force:
+            print(f"⏭️  Skipping '{md_path}': '{ipynb_path}' already exists (use --force)")
+            continue
+        jobs.append((md_path, ipynb_path))
+
+    if not jobs:
+        print(f"Nothing to convert in '{input_dir}'.")
+        return
+
+    print(f"🔄 Converting {len(jobs)} files from '{input_dir}' to '{output_dir}'...")
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(convert_markdown_to_notebook, md_path, ipynb_path)
+                   for md_path, ipynb_path in jobs]
+        for (md_path, _), future in zip(jobs, futures):
+            # convert_markdown_to_notebook() exits on errors, after printing them
+            try:
+                future.result()
+            except SystemExit:
+                failed += 1
+            # Any other error (e.g. the output directory cannot be created) only
+            # fails this file, the other conversions go on
+            except Exception as e:
+                print(f"❌ Error: Could not convert '{md_path}': {e}")
+                failed += 1
+
+    print(f"📚 Converted {len(jobs) - failed}/{len(jobs)} files")
+    if failed:
+        sys.exit(1)
+
+
 def main():
     """
     Main function that handles command line arguments and orchestrates the conversion.
     """
     # Set up argument parser for command line interface
     parser = argparse.ArgumentParser(
-        description="Convert a markdown file with code blocks to a Jupyter notebook",
+        description="Convert a markdown file (or a directory of markdown files) "
+                    "with code blocks to Jupyter notebooks",
         epilog="Example: python convert.py my_tutorial.md my_notebook.ipynb"
     )
 
     parser.add_argument(
         "input_path",
         type=str,
-        help="Path to the input markdown file"
+        help="Path to the input markdown file, or to a directory of markdown files"
     )
 
     parser.add_argument(
         "output_path",
         type=str,
-        help="Path for the output Jupyter notebook file"
+        help="Path for the output Jupyter notebook file, or output directory"
     )
 
     parser.add_argument(
@@ -163,18 +205,36 @@ def main():
         help="Overwrite output file if it already exists"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of processes used to convert a directory (default: number of CPUs)"
+    )
+
     # Parse command line arguments
     args = parser.parse_args()
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {args.jobs}")
+
     # Convert string paths to Path objects for better path handling
     input_path = Path(args.input_path)
     output_path = Path(args.output_path)
 
     # Validate input file exists
     if not input_path.exists():
-        print(f"❌ Error: Input file '{input_path}' does not exist.")
+        print(f"❌ Error: Input path '{input_path}' does not exist.")
         sys.exit(1)
 
+    # Convert a whole directory in parallel
+    if input_path.is_dir():
+        if output_path.exists() and not output_path.is_dir():
+            print(f"❌ Error: '{output_path}' is not a directory.")
+            sys.exit(1)
+        convert_directory(input_path, output_path, force=args.force, max_workers=args.jobs)
+        return
+
     if not input_path.is_file():
         print(f"❌ Error: '{input_path}' is not a file.")
         sys.exit(1)
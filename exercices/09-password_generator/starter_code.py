@@ -1,14 +1,61 @@
+import mmap
+import os
 import random
-from pathlib import Path
+import sys
 
 # Configuration constants
 N = 5  # Number of words in the password
 SEP = " "  # Separator between words
+NUM_WORDS_RANGE = range(1, 11)  # Accepted numbers of words (1 to 10)
+
+# Accepted numbers of words as they are written in a request ("1" to "10")
+_VALID_COUNTS = {str(n): n for n in NUM_WORDS_RANGE}
 
 # Path to word list file
-# Path(__file__).parent represents the path of the file we are working with
+# os.path.dirname(__file__) represents the folder of the file we are working with
 # Even if we execute the script from somewhere else, for ex. the root of the projects this will work.
-WORDS_PATH = Path(__file__).parent / "data" / "wordlist.txt"
+# A plain string built with os.path avoids importing pathlib for a single path
+WORDS_PATH = os.path.join(os.path.dirname(__file__), "data", "wordlist.txt")
+
+# Above this size (in bytes), the word list is memory-mapped instead of read at once
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def _load_words(path):
+    """Load the words of a word list file.
+
+    Small files are read as raw bytes and decoded in one go. Large files are
+    memory-mapped and decoded line by line, so that neither the whole file
+    content nor its decoded copy has to be held in memory.
+
+    Args:
+        path (str): Path to the word list file
+
+    Returns:
+        tuple[str, ...]: The words of the file
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return tuple(f.read().decode("utf-8").split())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Decode each line before splitting it, so that words are split on
+            # the same (Unicode) whitespace as in the small file case
+            return tuple(
+                w
+                for line in iter(mm.readline, b"")
+                for w in line.decode("utf-8").split()
+            )
+
+
+# Load word list once, when the module is imported
+# Every call to generate_password() then reuses it instead of re-reading the file
+_WORDS = _load_words(WORDS_PATH)
+
+# Random generator backed by the OS (os.urandom), suitable for passwords
+# Created once and reused, unlike the module-level random functions, which use
+# a Mersenne Twister that is not meant for security
+_RNG = random.SystemRandom()
 
 
 def generate_password(num_words=N, separator=SEP):
@@ -21,25 +68,58 @@ def generate_password(num_words=N, separator=SEP):
     Returns:
         str: The generated password
     """
-    # Load word list from file
-    with open(WORDS_PATH, "r", encoding="utf-8") as f:
-        lst_words = [w.strip() for w in f.readlines()]
-
     # Generate password by randomly sampling words without replacement
-    # random.sample() ensures each word appears only once in the password
-    result = random.sample(lst_words, k=num_words)
+    # sample() ensures each word appears only once in the password
+    result = _RNG.sample(_WORDS, k=num_words)
 
     # Join words with separator
     return separator.join(result)
 
 
+def serve(stdin=None, stdout=None):
+    """Answer password requests read from stdin, one per line, until EOF.
+
+    Each line holds the number of words of the password (empty line: N words).
+    Invalid requests (not a number in NUM_WORDS_RANGE) are answered with an
+    "error: ..." line, so that there is still exactly one answer per line.
+    Starting Python once and piping requests is much faster than running the
+    script once per password, which pays the interpreter start-up every time:
+        seq 1000 | sed 's/.*/4/' | python starter_code.py --daemon
+
+    Args:
+        stdin: File object to read the requests from (default: sys.stdin)
+        stdout: File object to write the passwords to (default: sys.stdout)
+    """
+    # Looked up at call time, so that redirections of sys.stdin/sys.stdout apply
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+
+    for line in stdin:
+        line = line.strip()
+
+        # Look the line up in _VALID_COUNTS instead of calling int() on it,
+        # which raises on arbitrary input (e.g. more than 4300 digits)
+        num_words = _VALID_COUNTS.get(line) if line else N
+        if num_words is not None:
+            answer = generate_password(num_words=num_words)
+        else:
+            answer = (f"error: expected a number of words between {NUM_WORDS_RANGE[0]} "
+                      f"and {NUM_WORDS_RANGE[-1]}, got {line!r}")
+
+        stdout.write(answer + "\n")
+        # Flush so that a program talking to us gets each answer right away
+        stdout.flush()
+
+
 if __name__ == "__main__":
-    # Load word list to show basic info
-    with open(WORDS_PATH, "r", encoding="utf-8") as f:
-        lst_words = [w.strip() for w in f.readlines()]
+    # Persistent mode: keep the word list loaded and read requests from stdin
+    if sys.argv[1:] == ["--daemon"]:
+        serve()
+        sys.exit(0)
 
-    print(f"Loaded {len(lst_words)} words")
-    print("First 5 words:", lst_words[:5])
+    # Show basic info about the word list
+    print(f"Loaded {len(_WORDS)} words")
+    print("First 5 words:", _WORDS[:5])
 
     # Generate and display password
     password = generate_password(num_words=N, separator=" ")